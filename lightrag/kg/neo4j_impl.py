@@ -1,7 +1,9 @@
+import asyncio
 import os
 import re
+import sys
 from dataclasses import dataclass
-from typing import final
+from typing import AsyncIterator, final
 import configparser
 
 
@@ -30,6 +32,15 @@ from neo4j import (  # type: ignore
     AsyncManagedTransaction,
 )
 
+try:
+    from neo4j import RoutingControl  # type: ignore
+
+    # driver.execute_query is only stable, and RoutingControl.READ only exists
+    # (it was READERS before), from neo4j driver 5.8 on
+    _READ_ROUTING = RoutingControl.READ
+except (ImportError, AttributeError):
+    _READ_ROUTING = None
+
 from dotenv import load_dotenv
 
 # use the .env that is inside the current folder
@@ -121,6 +132,19 @@ class Neo4JStorage(BaseGraphStorage):
                 "NEO4J_KEEP_ALIVE",
                 config.get("neo4j", "keep_alive", fallback="true"),
             ).lower() in ("true", "1", "yes", "on")
+            SWEEP_PAGE_SIZE = int(
+                os.environ.get(
+                    "NEO4J_SWEEP_PAGE_SIZE",
+                    config.get("neo4j", "sweep_page_size", fallback=10000),
+                )
+            )
+            if SWEEP_PAGE_SIZE < 1:
+                logger.warning(
+                    f"[{self.workspace}] Invalid NEO4J_SWEEP_PAGE_SIZE {SWEEP_PAGE_SIZE}, must be at least 1. Using 10000."
+                )
+                SWEEP_PAGE_SIZE = 10000
+            # Number of nodes fetched per page when sweeping the whole workspace
+            self._sweep_page_size = SWEEP_PAGE_SIZE
             DATABASE = os.environ.get(
                 "NEO4J_DATABASE", re.sub(r"[^a-zA-Z0-9-]", "-", self.namespace)
             )
@@ -205,13 +229,23 @@ class Neo4JStorage(BaseGraphStorage):
                     workspace_label = self._get_workspace_label()
                     try:
                         async with self._driver.session(database=database) as session:
-                            # Check if index exists first
-                            check_query = f"""
-                            CALL db.indexes() YIELD name, labelsOrTypes, properties
-                            WHERE labelsOrTypes = ['{workspace_label}'] AND properties = ['entity_id']
-                            RETURN count(*) > 0 AS exists
-                            """
                             try:
+                                # Idempotent, so re-initialization costs a single no-op statement
+                                result = await session.run(
+                                    f"CREATE INDEX IF NOT EXISTS FOR (n:`{workspace_label}`) ON (n.entity_id)"
+                                )
+                                summary = await result.consume()
+                                if summary.counters.indexes_added:
+                                    logger.info(
+                                        f"[{self.workspace}] Created index for {workspace_label} nodes on entity_id in {database}"
+                                    )
+                            except neo4jExceptions.ClientError:
+                                # Fallback for Neo4j versions without IF NOT EXISTS support
+                                check_query = f"""
+                                CALL db.indexes() YIELD name, labelsOrTypes, properties
+                                WHERE labelsOrTypes = ['{workspace_label}'] AND properties = ['entity_id']
+                                RETURN count(*) > 0 AS exists
+                                """
                                 check_result = await session.run(check_query)
                                 record = await check_result.single()
                                 await check_result.consume()
@@ -227,12 +261,6 @@ class Neo4JStorage(BaseGraphStorage):
                                     logger.info(
                                         f"[{self.workspace}] Created index for {workspace_label} nodes on entity_id in {database}"
                                     )
-                            except Exception:
-                                # Fallback if db.indexes() is not supported in this Neo4j version
-                                result = await session.run(
-                                    f"CREATE INDEX IF NOT EXISTS FOR (n:`{workspace_label}`) ON (n.entity_id)"
-                                )
-                                await result.consume()
                     except Exception as e:
                         logger.warning(
                             f"[{self.workspace}] Failed to create index: {str(e)}"
@@ -254,6 +282,31 @@ class Neo4JStorage(BaseGraphStorage):
         # Noe4J handles persistence automatically
         pass
 
+    async def _read_records(self, query: str, **params) -> list:
+        """Run a short read query and return all of its records
+
+        Uses driver.execute_query, which manages the session and consumes the
+        result, when the installed driver supports it (5.8+). Older drivers fall
+        back to a plain read session.
+        """
+        if _READ_ROUTING is not None:
+            records, _, _ = await self._driver.execute_query(
+                query,
+                parameters_=params,
+                database_=self._DATABASE,
+                routing_=_READ_ROUTING,
+            )
+            return records
+
+        async with self._driver.session(
+            database=self._DATABASE, default_access_mode="READ"
+        ) as session:
+            result = await session.run(query, params)
+            try:
+                return [record async for record in result]
+            finally:
+                await result.consume()  # Ensure result is fully consumed
+
     async def has_node(self, node_id: str) -> bool:
         """
         Check if a node with the given label exists in the database
@@ -269,21 +322,15 @@ class Neo4JStorage(BaseGraphStorage):
             Exception: If there is an error executing the query
         """
         workspace_label = self._get_workspace_label()
-        async with self._driver.session(
-            database=self._DATABASE, default_access_mode="READ"
-        ) as session:
-            try:
-                query = f"MATCH (n:`{workspace_label}` {{entity_id: $entity_id}}) RETURN count(n) > 0 AS node_exists"
-                result = await session.run(query, entity_id=node_id)
-                single_result = await result.single()
-                await result.consume()  # Ensure result is fully consumed
-                return single_result["node_exists"]
-            except Exception as e:
-                logger.error(
-                    f"[{self.workspace}] Error checking node existence for {node_id}: {str(e)}"
-                )
-                await result.consume()  # Ensure results are consumed even on error
-                raise
+        try:
+            query = f"MATCH (n:`{workspace_label}` {{entity_id: $entity_id}}) RETURN count(n) > 0 AS node_exists"
+            records = await self._read_records(query, entity_id=node_id)
+            return records[0]["node_exists"]
+        except Exception as e:
+            logger.error(
+                f"[{self.workspace}] Error checking node existence for {node_id}: {str(e)}"
+            )
+            raise
 
     async def has_edge(self, source_node_id: str, target_node_id: str) -> bool:
         """
@@ -301,28 +348,22 @@ class Neo4JStorage(BaseGraphStorage):
             Exception: If there is an error executing the query
         """
         workspace_label = self._get_workspace_label()
-        async with self._driver.session(
-            database=self._DATABASE, default_access_mode="READ"
-        ) as session:
-            try:
-                query = (
-                    f"MATCH (a:`{workspace_label}` {{entity_id: $source_entity_id}})-[r]-(b:`{workspace_label}` {{entity_id: $target_entity_id}}) "
-                    "RETURN COUNT(r) > 0 AS edgeExists"
-                )
-                result = await session.run(
-                    query,
-                    source_entity_id=source_node_id,
-                    target_entity_id=target_node_id,
-                )
-                single_result = await result.single()
-                await result.consume()  # Ensure result is fully consumed
-                return single_result["edgeExists"]
-            except Exception as e:
-                logger.error(
-                    f"[{self.workspace}] Error checking edge existence between {source_node_id} and {target_node_id}: {str(e)}"
-                )
-                await result.consume()  # Ensure results are consumed even on error
-                raise
+        try:
+            query = (
+                f"MATCH (a:`{workspace_label}` {{entity_id: $source_entity_id}})-[r]-(b:`{workspace_label}` {{entity_id: $target_entity_id}}) "
+                "RETURN COUNT(r) > 0 AS edgeExists"
+            )
+            records = await self._read_records(
+                query,
+                source_entity_id=source_node_id,
+                target_entity_id=target_node_id,
+            )
+            return records[0]["edgeExists"]
+        except Exception as e:
+            logger.error(
+                f"[{self.workspace}] Error checking edge existence between {source_node_id} and {target_node_id}: {str(e)}"
+            )
+            raise
 
     async def get_node(self, node_id: str) -> dict[str, str] | None:
         """Get node by its label identifier, return only node properties
@@ -387,6 +428,9 @@ class Neo4JStorage(BaseGraphStorage):
         Returns:
             A dictionary mapping each node_id to its node data (or None if not found).
         """
+        if not node_ids:
+            return {}
+
         workspace_label = self._get_workspace_label()
         async with self._driver.session(
             database=self._DATABASE, default_access_mode="READ"
@@ -394,14 +438,13 @@ class Neo4JStorage(BaseGraphStorage):
             query = f"""
             UNWIND $node_ids AS id
             MATCH (n:`{workspace_label}` {{entity_id: id}})
-            RETURN n.entity_id AS entity_id, n
+            RETURN n.entity_id AS entity_id, properties(n) AS properties
             """
             result = await session.run(query, node_ids=node_ids)
             nodes = {}
             async for record in result:
                 entity_id = record["entity_id"]
-                node = record["n"]
-                node_dict = dict(node)
+                node_dict = record["properties"]
                 # Remove the workspace label if present in a 'labels' property
                 if "labels" in node_dict:
                     node_dict["labels"] = [
@@ -472,6 +515,9 @@ class Neo4JStorage(BaseGraphStorage):
             A dictionary mapping each node_id to its degree (number of relationships).
             If a node is not found, its degree will be set to 0.
         """
+        if not node_ids:
+            return {}
+
         workspace_label = self._get_workspace_label()
         async with self._driver.session(
             database=self._DATABASE, default_access_mode="READ"
@@ -509,8 +555,9 @@ class Neo4JStorage(BaseGraphStorage):
         Returns:
             int: Sum of the degrees of both nodes
         """
-        src_degree = await self.node_degree(src_id)
-        trg_degree = await self.node_degree(tgt_id)
+        src_degree, trg_degree = await asyncio.gather(
+            self.node_degree(src_id), self.node_degree(tgt_id)
+        )
 
         # Convert None to 0 for addition
         src_degree = 0 if src_degree is None else src_degree
@@ -644,6 +691,9 @@ class Neo4JStorage(BaseGraphStorage):
         Returns:
             A dictionary mapping (src, tgt) tuples to their edge properties.
         """
+        if not pairs:
+            return {}
+
         workspace_label = self._get_workspace_label()
         async with self._driver.session(
             database=self._DATABASE, default_access_mode="READ"
@@ -651,16 +701,16 @@ class Neo4JStorage(BaseGraphStorage):
             query = f"""
             UNWIND $pairs AS pair
             MATCH (start:`{workspace_label}` {{entity_id: pair.src}})-[r:DIRECTED]-(end:`{workspace_label}` {{entity_id: pair.tgt}})
-            RETURN pair.src AS src_id, pair.tgt AS tgt_id, collect(properties(r)) AS edges
+            RETURN pair.src AS src_id, pair.tgt AS tgt_id, head(collect(properties(r))) AS edge_props
             """
             result = await session.run(query, pairs=pairs)
             edges_dict = {}
             async for record in result:
                 src = record["src_id"]
                 tgt = record["tgt_id"]
-                edges = record["edges"]
-                if edges and len(edges) > 0:
-                    edge_props = edges[0]  # choose the first if multiple exist
+                # Only the first edge is used if multiple exist, so only it is returned
+                edge_props = record["edge_props"]
+                if edge_props:
                     # Ensure required keys exist with defaults
                     for key, default in {
                         "weight": 1.0,
@@ -705,29 +755,16 @@ class Neo4JStorage(BaseGraphStorage):
                     query = f"""MATCH (n:`{workspace_label}` {{entity_id: $entity_id}})
                             OPTIONAL MATCH (n)-[r]-(connected:`{workspace_label}`)
                             WHERE connected.entity_id IS NOT NULL
-                            RETURN n, r, connected"""
+                            RETURN n.entity_id AS source_label,
+                                   connected.entity_id AS target_label"""
                     results = await session.run(query, entity_id=source_node_id)
 
                     edges = []
                     async for record in results:
-                        source_node = record["n"]
-                        connected_node = record["connected"]
-
-                        # Skip if either node is None
-                        if not source_node or not connected_node:
-                            continue
-
-                        source_label = (
-                            source_node.get("entity_id")
-                            if source_node.get("entity_id")
-                            else None
-                        )
-                        target_label = (
-                            connected_node.get("entity_id")
-                            if connected_node.get("entity_id")
-                            else None
-                        )
+                        source_label = record["source_label"]
+                        target_label = record["target_label"]
 
+                        # Skip rows without a connected node (no edges) or missing ids
                         if source_label and target_label:
                             edges.append((source_label, target_label))
 
@@ -762,6 +799,9 @@ class Neo4JStorage(BaseGraphStorage):
             - Outgoing edges: (queried_node, connected_node)
             - Incoming edges: (connected_node, queried_node)
         """
+        if not node_ids:
+            return {}
+
         async with self._driver.session(
             database=self._DATABASE, default_access_mode="READ"
         ) as session:
@@ -771,9 +811,9 @@ class Neo4JStorage(BaseGraphStorage):
                 UNWIND $node_ids AS id
                 MATCH (n:`{workspace_label}` {{entity_id: id}})
                 OPTIONAL MATCH (n)-[r]-(connected:`{workspace_label}`)
-                RETURN id AS queried_id, n.entity_id AS node_entity_id,
+                RETURN id AS queried_id,
                        connected.entity_id AS connected_entity_id,
-                       startNode(r).entity_id AS start_entity_id
+                       startNode(r) = n AS is_outgoing
             """
             result = await session.run(query, node_ids=node_ids)
 
@@ -782,29 +822,31 @@ class Neo4JStorage(BaseGraphStorage):
 
             # Process results to include both outgoing and incoming edges
             async for record in result:
+                # n is matched on entity_id, so queried_id is also n's entity_id
                 queried_id = record["queried_id"]
-                node_entity_id = record["node_entity_id"]
                 connected_entity_id = record["connected_entity_id"]
-                start_entity_id = record["start_entity_id"]
 
                 # Skip if either node is None
-                if not node_entity_id or not connected_entity_id:
+                if not queried_id or not connected_entity_id:
                     continue
 
                 # Determine the actual direction of the edge
                 # If the start node is the queried node, it's an outgoing edge
                 # Otherwise, it's an incoming edge
-                if start_entity_id == node_entity_id:
+                if record["is_outgoing"]:
                     # Outgoing edge: (queried_node -> connected_node)
-                    edges_dict[queried_id].append((node_entity_id, connected_entity_id))
+                    edges_dict[queried_id].append((queried_id, connected_entity_id))
                 else:
                     # Incoming edge: (connected_node -> queried_node)
-                    edges_dict[queried_id].append((connected_entity_id, node_entity_id))
+                    edges_dict[queried_id].append((connected_entity_id, queried_id))
 
             await result.consume()  # Ensure results are fully consumed
             return edges_dict
 
     async def get_nodes_by_chunk_ids(self, chunk_ids: list[str]) -> list[dict]:
+        if not chunk_ids:
+            return []
+
         workspace_label = self._get_workspace_label()
         async with self._driver.session(
             database=self._DATABASE, default_access_mode="READ"
@@ -813,13 +855,13 @@ class Neo4JStorage(BaseGraphStorage):
             UNWIND $chunk_ids AS chunk_id
             MATCH (n:`{workspace_label}`)
             WHERE n.source_id IS NOT NULL AND chunk_id IN split(n.source_id, $sep)
-            RETURN DISTINCT n
+            WITH DISTINCT n
+            RETURN properties(n) AS properties
             """
             result = await session.run(query, chunk_ids=chunk_ids, sep=GRAPH_FIELD_SEP)
             nodes = []
             async for record in result:
-                node = record["n"]
-                node_dict = dict(node)
+                node_dict = record["properties"]
                 # Add node id (entity_id) to the dictionary for easier access
                 node_dict["id"] = node_dict.get("entity_id")
                 nodes.append(node_dict)
@@ -827,6 +869,9 @@ class Neo4JStorage(BaseGraphStorage):
             return nodes
 
     async def get_edges_by_chunk_ids(self, chunk_ids: list[str]) -> list[dict]:
+        if not chunk_ids:
+            return []
+
         workspace_label = self._get_workspace_label()
         async with self._driver.session(
             database=self._DATABASE, default_access_mode="READ"
@@ -938,7 +983,6 @@ class Neo4JStorage(BaseGraphStorage):
                     MATCH (target:`{workspace_label}` {{entity_id: $target_entity_id}})
                     MERGE (source)-[r:DIRECTED]-(target)
                     SET r += $properties
-                    RETURN r, source, target
                     """
                     result = await tx.run(
                         query,
@@ -946,10 +990,7 @@ class Neo4JStorage(BaseGraphStorage):
                         target_entity_id=target_node_id,
                         properties=edge_properties,
                     )
-                    try:
-                        await result.fetch(2)
-                    finally:
-                        await result.consume()  # Ensure result is consumed
+                    await result.consume()  # Ensure result is consumed
 
                 await session.execute_write(execute_upsert)
         except Exception as e:
@@ -1192,7 +1233,7 @@ class Neo4JStorage(BaseGraphStorage):
         visited_edges = set()
         visited_edge_pairs = set()
 
-        # Get the starting node's data
+        # One read session serves the start node lookup and every BFS step
         workspace_label = self._get_workspace_label()
         async with self._driver.session(
             database=self._DATABASE, default_access_mode="READ"
@@ -1216,47 +1257,43 @@ class Neo4JStorage(BaseGraphStorage):
             finally:
                 await node_result.consume()  # Ensure results are consumed
 
-        # Initialize queue for BFS with (node, edge, depth) tuples
-        # edge is None for the starting node
-        queue = deque([(start_node, None, 0)])
+            # Initialize queue for BFS with (node, edge, depth) tuples
+            # edge is None for the starting node
+            queue = deque([(start_node, None, 0)])
 
-        # True BFS implementation using a queue
-        while queue and len(visited_nodes) < max_nodes:
-            # Dequeue the next node to process
-            current_node, current_edge, current_depth = queue.popleft()
+            # True BFS implementation using a queue
+            while queue and len(visited_nodes) < max_nodes:
+                # Dequeue the next node to process
+                current_node, current_edge, current_depth = queue.popleft()
 
-            # Skip if already visited or exceeds max depth
-            if current_node.id in visited_nodes:
-                continue
+                # Skip if already visited or exceeds max depth
+                if current_node.id in visited_nodes:
+                    continue
 
-            if current_depth > max_depth:
-                logger.debug(
-                    f"[{self.workspace}] Skipping node at depth {current_depth} (max_depth: {max_depth})"
-                )
-                continue
-
-            # Add current node to result
-            result.nodes.append(current_node)
-            visited_nodes.add(current_node.id)
-
-            # Add edge to result if it exists and not already added
-            if current_edge and current_edge.id not in visited_edges:
-                result.edges.append(current_edge)
-                visited_edges.add(current_edge.id)
-
-            # Stop if we've reached the node limit
-            if len(visited_nodes) >= max_nodes:
-                result.is_truncated = True
-                logger.info(
-                    f"[{self.workspace}] Graph truncated: breadth-first search limited to: {max_nodes} nodes"
-                )
-                break
+                if current_depth > max_depth:
+                    logger.debug(
+                        f"[{self.workspace}] Skipping node at depth {current_depth} (max_depth: {max_depth})"
+                    )
+                    continue
 
-            # Get all edges and target nodes for the current node (even at max_depth)
-            async with self._driver.session(
-                database=self._DATABASE, default_access_mode="READ"
-            ) as session:
-                workspace_label = self._get_workspace_label()
+                # Add current node to result
+                result.nodes.append(current_node)
+                visited_nodes.add(current_node.id)
+
+                # Add edge to result if it exists and not already added
+                if current_edge and current_edge.id not in visited_edges:
+                    result.edges.append(current_edge)
+                    visited_edges.add(current_edge.id)
+
+                # Stop if we've reached the node limit
+                if len(visited_nodes) >= max_nodes:
+                    result.is_truncated = True
+                    logger.info(
+                        f"[{self.workspace}] Graph truncated: breadth-first search limited to: {max_nodes} nodes"
+                    )
+                    break
+
+                # Get all edges and target nodes for the current node (even at max_depth)
                 query = f"""
                 MATCH (a:`{workspace_label}` {{entity_id: $entity_id}})-[r]-(b)
                 WITH r, b, id(r) as edge_id, id(b) as target_id
@@ -1264,7 +1301,7 @@ class Neo4JStorage(BaseGraphStorage):
                 """
                 results = await session.run(query, entity_id=current_node.id)
 
-                # Get all records and release database connection
+                # Fetch all neighbor records up front so the result is consumed before processing
                 records = await results.fetch(1000)  # Max neighbor nodes we can handle
                 await results.consume()  # Ensure results are consumed
 
@@ -1474,54 +1511,164 @@ class Neo4JStorage(BaseGraphStorage):
                 logger.error(f"[{self.workspace}] Error during edge deletion: {str(e)}")
                 raise
 
-    async def get_all_nodes(self) -> list[dict]:
-        """Get all nodes in the graph.
-
-        Returns:
-            A list of all nodes, where each node is a dictionary of its properties
+    def _sweep_node_dict(self, node_dict: dict) -> dict:
+        """Prepare a node property map returned by the node sweep"""
+        # Add node id (entity_id) to the dictionary for easier access
+        node_dict["id"] = node_dict.get("entity_id")
+        # A workspace has only a handful of distinct entity types, so
+        # share one string object per type across the whole sweep
+        entity_type = node_dict.get("entity_type")
+        if isinstance(entity_type, str):
+            node_dict["entity_type"] = sys.intern(entity_type)
+        return node_dict
+
+    async def _iter_all_nodes(self) -> AsyncIterator[dict]:
+        """Stream all nodes in the workspace, yielding one node dict per record
+
+        The sweep is paginated with keyset pagination on the indexed entity_id
+        property, so each query works on a bounded page instead of asking the
+        server to scan and ship the whole workspace in a single result. A page
+        is a run of distinct entity_id values together with every node carrying
+        them, so nodes sharing an entity_id (entity_id is not unique) are never
+        split by a page boundary. Nodes without an entity_id cannot be keyed;
+        they are fetched by one extra query after the paged sweep, so the result
+        matches an unpaged MATCH.
         """
         workspace_label = self._get_workspace_label()
+        page_size = self._sweep_page_size
+        cursor = None
         async with self._driver.session(
             database=self._DATABASE, default_access_mode="READ"
         ) as session:
+            while True:
+                condition = (
+                    "n.entity_id IS NOT NULL"
+                    if cursor is None
+                    else "n.entity_id > $cursor"
+                )
+                query = f"""
+                MATCH (n:`{workspace_label}`)
+                WHERE {condition}
+                WITH DISTINCT n.entity_id AS page_id
+                ORDER BY page_id
+                LIMIT $limit
+                MATCH (n:`{workspace_label}` {{entity_id: page_id}})
+                RETURN page_id, properties(n) AS properties
+                ORDER BY page_id
+                """
+                result = await session.run(query, cursor=cursor, limit=page_size)
+                page_ids = 0
+                try:
+                    async for record in result:
+                        # Rows arrive ordered by page_id, the last one is the cursor
+                        if record["page_id"] != cursor:
+                            cursor = record["page_id"]
+                            page_ids += 1
+                        yield self._sweep_node_dict(record["properties"])
+                finally:
+                    await result.consume()  # Ensure result is consumed on early exit
+                # LIMIT counts distinct entity_id values, and so does page_ids
+                if page_ids < page_size:
+                    break
+
             query = f"""
             MATCH (n:`{workspace_label}`)
-            RETURN n
+            WHERE n.entity_id IS NULL
+            RETURN properties(n) AS properties
             """
             result = await session.run(query)
-            nodes = []
-            async for record in result:
-                node = record["n"]
-                node_dict = dict(node)
-                # Add node id (entity_id) to the dictionary for easier access
-                node_dict["id"] = node_dict.get("entity_id")
-                nodes.append(node_dict)
-            await result.consume()
-            return nodes
+            try:
+                async for record in result:
+                    yield self._sweep_node_dict(record["properties"])
+            finally:
+                await result.consume()  # Ensure result is consumed on early exit
 
-    async def get_all_edges(self) -> list[dict]:
-        """Get all edges in the graph.
+    async def _iter_all_edges(self) -> AsyncIterator[dict]:
+        """Stream all edges in the workspace, yielding one edge dict per record
 
-        Returns:
-            A list of all edges, where each edge is a dictionary of its properties
+        Edges are fetched page by page of distinct source entity_id values
+        (keyset pagination as in _iter_all_nodes), each page covering every
+        node that carries those values. Rows for a source entity_id never span
+        two pages, so DISTINCT within a page matches DISTINCT over the whole
+        sweep. Edges of source nodes without an entity_id are fetched by one
+        extra query after the paged sweep.
         """
         workspace_label = self._get_workspace_label()
+        page_size = self._sweep_page_size
+        cursor = None
         async with self._driver.session(
             database=self._DATABASE, default_access_mode="READ"
         ) as session:
+            while True:
+                condition = (
+                    "a.entity_id IS NOT NULL"
+                    if cursor is None
+                    else "a.entity_id > $cursor"
+                )
+                query = f"""
+                MATCH (a:`{workspace_label}`)
+                WHERE {condition}
+                WITH DISTINCT a.entity_id AS source
+                ORDER BY source
+                LIMIT $limit
+                MATCH (a:`{workspace_label}` {{entity_id: source}})
+                OPTIONAL MATCH (a)-[r]-(b:`{workspace_label}`)
+                RETURN DISTINCT source, b.entity_id AS target, properties(r) AS properties
+                ORDER BY source
+                """
+                result = await session.run(query, cursor=cursor, limit=page_size)
+                page_sources = 0
+                try:
+                    async for record in result:
+                        source = record["source"]
+                        # Rows arrive ordered by source, so the last source is the cursor
+                        if source != cursor:
+                            cursor = source
+                            page_sources += 1
+                        # Source nodes without edges only advance the cursor
+                        if record["properties"] is None:
+                            continue
+                        edge_properties = record["properties"]
+                        edge_properties["source"] = source
+                        edge_properties["target"] = record["target"]
+                        yield edge_properties
+                finally:
+                    await result.consume()  # Ensure result is consumed on early exit
+                # Every source in the page yields at least one row (OPTIONAL MATCH),
+                # so page_sources counts the same distinct values LIMIT does
+                if page_sources < page_size:
+                    break
+
             query = f"""
             MATCH (a:`{workspace_label}`)-[r]-(b:`{workspace_label}`)
+            WHERE a.entity_id IS NULL
             RETURN DISTINCT a.entity_id AS source, b.entity_id AS target, properties(r) AS properties
             """
             result = await session.run(query)
-            edges = []
-            async for record in result:
-                edge_properties = record["properties"]
-                edge_properties["source"] = record["source"]
-                edge_properties["target"] = record["target"]
-                edges.append(edge_properties)
-            await result.consume()
-            return edges
+            try:
+                async for record in result:
+                    edge_properties = record["properties"]
+                    edge_properties["source"] = record["source"]
+                    edge_properties["target"] = record["target"]
+                    yield edge_properties
+            finally:
+                await result.consume()  # Ensure result is consumed on early exit
+
+    async def get_all_nodes(self) -> list[dict]:
+        """Get all nodes in the graph.
+
+        Returns:
+            A list of all nodes, where each node is a dictionary of its properties
+        """
+        return [node async for node in self._iter_all_nodes()]
+
+    async def get_all_edges(self) -> list[dict]:
+        """Get all edges in the graph.
+
+        Returns:
+            A list of all edges, where each edge is a dictionary of its properties
+        """
+        return [edge async for edge in self._iter_all_edges()]
 
     async def drop(self) -> dict[str, str]:
         """Drop all data from current workspace storage and clean up resources
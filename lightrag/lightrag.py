@@ -725,9 +725,11 @@ class LightRAG:
         doc_entities = {}  # doc_id -> set of entity_names
         doc_relations = {}  # doc_id -> set of relation_pairs (as tuples)
 
-        # Get all nodes and edges from graph
-        all_nodes = await self.chunk_entity_relation_graph.get_all_nodes()
-        all_edges = await self.chunk_entity_relation_graph.get_all_edges()
+        # Get all nodes and edges from graph, fetching both sweeps concurrently
+        all_nodes, all_edges = await asyncio.gather(
+            self.chunk_entity_relation_graph.get_all_nodes(),
+            self.chunk_entity_relation_graph.get_all_edges(),
+        )
 
         # Process all nodes once
         for node in all_nodes:
@@ -1889,8 +1891,9 @@ class LightRAG:
                     self.text_chunks.upsert(all_chunks_data),
                 )
 
-            # Insert entities into knowledge graph
-            all_entities_data: list[dict[str, str]] = []
+            # Insert entities into knowledge graph, building their vector storage
+            # payloads in the same pass
+            entities_for_vdb: dict[str, dict[str, str]] = {}
             for entity_data in custom_kg.get("entities", []):
                 entity_name = entity_data["entity_name"]
                 entity_type = entity_data.get("entity_type", "UNKNOWN")
@@ -1918,12 +1921,19 @@ class LightRAG:
                 await self.chunk_entity_relation_graph.upsert_node(
                     entity_name, node_data=node_data
                 )
-                node_data["entity_name"] = entity_name
-                all_entities_data.append(node_data)
+                entities_for_vdb[compute_mdhash_id(entity_name, prefix="ent-")] = {
+                    "content": entity_name + "\n" + description,
+                    "entity_name": entity_name,
+                    "source_id": source_id,
+                    "description": description,
+                    "entity_type": entity_type,
+                    "file_path": file_path,
+                }
                 update_storage = True
 
-            # Insert relationships into knowledge graph
-            all_relationships_data: list[dict[str, str]] = []
+            # Insert relationships into knowledge graph, building their vector
+            # storage payloads in the same pass
+            relationships_for_vdb: dict[str, dict[str, str]] = {}
             for relationship_data in custom_kg.get("relationships", []):
                 src_id = relationship_data["src_id"]
                 tgt_id = relationship_data["tgt_id"]
@@ -1971,48 +1981,25 @@ class LightRAG:
                     },
                 )
 
-                edge_data: dict[str, str] = {
+                relationships_for_vdb[
+                    compute_mdhash_id(src_id + tgt_id, prefix="rel-")
+                ] = {
                     "src_id": src_id,
                     "tgt_id": tgt_id,
-                    "description": description,
-                    "keywords": keywords,
                     "source_id": source_id,
+                    "content": f"{keywords}\t{src_id}\n{tgt_id}\n{description}",
+                    "keywords": keywords,
+                    "description": description,
                     "weight": weight,
                     "file_path": file_path,
-                    "created_at": int(time.time()),
                 }
-                all_relationships_data.append(edge_data)
                 update_storage = True
 
             # Insert entities into vector storage with consistent format
-            data_for_vdb = {
-                compute_mdhash_id(dp["entity_name"], prefix="ent-"): {
-                    "content": dp["entity_name"] + "\n" + dp["description"],
-                    "entity_name": dp["entity_name"],
-                    "source_id": dp["source_id"],
-                    "description": dp["description"],
-                    "entity_type": dp["entity_type"],
-                    "file_path": dp.get("file_path", "custom_kg"),
-                }
-                for dp in all_entities_data
-            }
-            await self.entities_vdb.upsert(data_for_vdb)
+            await self.entities_vdb.upsert(entities_for_vdb)
 
             # Insert relationships into vector storage with consistent format
-            data_for_vdb = {
-                compute_mdhash_id(dp["src_id"] + dp["tgt_id"], prefix="rel-"): {
-                    "src_id": dp["src_id"],
-                    "tgt_id": dp["tgt_id"],
-                    "source_id": dp["source_id"],
-                    "content": f"{dp['keywords']}\t{dp['src_id']}\n{dp['tgt_id']}\n{dp['description']}",
-                    "keywords": dp["keywords"],
-                    "description": dp["description"],
-                    "weight": dp["weight"],
-                    "file_path": dp.get("file_path", "custom_kg"),
-                }
-                for dp in all_relationships_data
-            }
-            await self.relationships_vdb.upsert(data_for_vdb)
+            await self.relationships_vdb.upsert(relationships_for_vdb)
 
         except Exception as e:
             logger.error(f"Error in ainsert_custom_kg: {e}")
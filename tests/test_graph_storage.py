@@ -1164,6 +1164,103 @@ async def test_graph_undirected_property(storage):
         return False
 
 
+async def test_graph_full_scan(storage):
+    """
+    测试全图遍历 get_all_nodes / get_all_edges:
+    1. 使用很小的分页大小（如果存储支持分页），迫使遍历跨越多个分页
+    2. 节点数恰好是分页大小的整数倍
+    3. 包含没有边的节点、自环边，以及一个源节点拥有多条边的情况
+    4. 验证没有遗漏或重复的节点和边
+    """
+    # Neo4JStorage 按分页遍历全图，这里临时调小分页大小
+    original_page_size = getattr(storage, "_sweep_page_size", None)
+    page_size = 3
+    try:
+        if original_page_size is not None:
+            storage._sweep_page_size = page_size
+            print(f"使用分页大小: {page_size}")
+
+        # 清空数据，保证节点和边的数量可精确校验
+        await storage.drop()
+
+        # 1. 插入节点，数量为分页大小的整数倍
+        node_ids = [f"全量遍历_{i:02d}" for i in range(page_size * 2)]
+        for node_id in node_ids:
+            await storage.upsert_node(
+                node_id,
+                {
+                    "entity_id": node_id,
+                    "description": f"{node_id} 的描述",
+                    "entity_type": "测试节点",
+                },
+            )
+        print(f"插入节点: {len(node_ids)} 个")
+
+        # 2. 插入边: 节点0有多条边，节点2有自环，最后一个节点没有边
+        edge_pairs = [
+            (node_ids[0], node_ids[1]),
+            (node_ids[0], node_ids[2]),
+            (node_ids[0], node_ids[3]),
+            (node_ids[2], node_ids[2]),
+            (node_ids[3], node_ids[4]),
+        ]
+        for src, tgt in edge_pairs:
+            await storage.upsert_edge(
+                src,
+                tgt,
+                {
+                    "relationship": "连接",
+                    "weight": 1.0,
+                    "description": f"{src} 连接 {tgt}",
+                },
+            )
+        print(f"插入边: {len(edge_pairs)} 条")
+
+        # 3. 验证 get_all_nodes
+        all_nodes = await storage.get_all_nodes()
+        returned_node_ids = [
+            node.get("entity_id") or node.get("id") for node in all_nodes
+        ]
+        print(f"get_all_nodes 返回节点数: {len(returned_node_ids)}")
+        assert len(returned_node_ids) == len(
+            set(returned_node_ids)
+        ), f"get_all_nodes 返回了重复节点: {returned_node_ids}"
+        assert set(returned_node_ids) == set(
+            node_ids
+        ), f"get_all_nodes 返回的节点不正确: {returned_node_ids}"
+
+        # 4. 验证 get_all_edges（无向图，不同存储可能返回一个或两个方向）
+        all_edges = await storage.get_all_edges()
+        directed_pairs = [(edge["source"], edge["target"]) for edge in all_edges]
+        print(f"get_all_edges 返回边记录数: {len(directed_pairs)}")
+        assert len(directed_pairs) == len(
+            set(directed_pairs)
+        ), f"get_all_edges 返回了重复边: {directed_pairs}"
+        undirected_pairs = {frozenset(pair) for pair in directed_pairs}
+        expected_pairs = {frozenset(pair) for pair in edge_pairs}
+        assert (
+            undirected_pairs == expected_pairs
+        ), f"get_all_edges 返回的边不正确: {directed_pairs}"
+        assert all(
+            node_ids[-1] not in pair for pair in directed_pairs
+        ), f"没有边的节点 {node_ids[-1]} 不应出现在边结果中"
+        for edge in all_edges:
+            assert (
+                edge.get("description") == f"{edge['source']} 连接 {edge['target']}"
+                or edge.get("description") == f"{edge['target']} 连接 {edge['source']}"
+            ), f"边属性不正确: {edge}"
+
+        print("全图遍历测试完成")
+        return True
+
+    except Exception as e:
+        ASCIIColors.red(f"测试过程中发生错误: {str(e)}")
+        return False
+    finally:
+        if original_page_size is not None:
+            storage._sweep_page_size = original_page_size
+
+
 async def main():
     """主函数"""
     # 显示程序标题
@@ -1201,12 +1298,15 @@ async def main():
         ASCIIColors.white("3. 批量操作测试 (批量获取节点、边属性和度数等)")
         ASCIIColors.white("4. 无向图特性测试 (验证存储的无向图特性)")
         ASCIIColors.white("5. 特殊字符测试 (验证单引号、双引号和反斜杠等特殊字符)")
-        ASCIIColors.white("6. 全部测试")
+        ASCIIColors.white(
+            "6. 全图遍历测试 (验证 get_all_nodes / get_all_edges 的分页遍历)"
+        )
+        ASCIIColors.white("7. 全部测试")
 
-        choice = input("\n请输入选项 (1/2/3/4/5/6): ")
+        choice = input("\n请输入选项 (1/2/3/4/5/6/7): ")
 
         # 在执行测试前清理数据
-        if choice in ["1", "2", "3", "4", "5", "6"]:
+        if choice in ["1", "2", "3", "4", "5", "6", "7"]:
             ASCIIColors.yellow("\n执行测试前清理数据...")
             await storage.drop()
             ASCIIColors.green("数据清理完成\n")
@@ -1222,6 +1322,8 @@ async def main():
         elif choice == "5":
             await test_graph_special_characters(storage)
         elif choice == "6":
+            await test_graph_full_scan(storage)
+        elif choice == "7":
             ASCIIColors.cyan("\n=== 开始基本测试 ===")
             basic_result = await test_graph_basic(storage)
 
@@ -1241,7 +1343,13 @@ async def main():
 
                         if undirected_result:
                             ASCIIColors.cyan("\n=== 开始特殊字符测试 ===")
-                            await test_graph_special_characters(storage)
+                            special_result = await test_graph_special_characters(
+                                storage
+                            )
+
+                            if special_result:
+                                ASCIIColors.cyan("\n=== 开始全图遍历测试 ===")
+                                await test_graph_full_scan(storage)
         else:
             ASCIIColors.red("无效的选项")
 